@@ -358,6 +358,12 @@ ADD_PATH_ACT_DICT = {
     2: 'send',
     3: 'both'
 }
+
+ADD_PATH_ACT_STR_DICT = {
+    'receive': 1,
+    'send': 2,
+    'both': 3
+}
 # BGP FSM State
 ST_IDLE = 1
 ST_CONNECT = 2
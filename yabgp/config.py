@@ -111,6 +111,19 @@ CONF.register_cli_opts(BGP_PEER_TIME_OPTS, group='time')
 LOG = logging.getLogger(__name__)
 
 
+def convert_addpath_config(local_add_path):
+    """
+    Convert local_add_path items such as 'ipv4_lu_both' to add path capability dicts
+    :param local_add_path: list of '<afi_safi>_<send/receive>' strings
+    :return: list of {'afi_safi': ..., 'send/receive': ...} dicts
+    """
+    add_path = []
+    for item in local_add_path:
+        afi_safi, send_receive = item.rsplit('_', 1)
+        add_path.append({'afi_safi': afi_safi, 'send/receive': send_receive})
+    return add_path
+
+
 def get_bgp_config():
     """
     Get BGP running config
@@ -134,10 +147,7 @@ def get_bgp_config():
                     'enhanced_route_refresh': CONF.bgp.enhanced_route_refresh,
                     'graceful_restart': CONF.bgp.graceful_restart,
                     'cisco_multi_session': CONF.bgp.cisco_multi_session,
-                    'add_path': [
-                        {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-                        for item in CONF.bgp.local_add_path
-                    ]
+                    'add_path': convert_addpath_config(CONF.bgp.local_add_path)
                 },
                 'remote': {}
             }
@@ -22,6 +22,21 @@ from yabgp.common import exception as excep
 from yabgp.common import constants as bgp_cons
 
 
+# The segment length is a single octet, so there are at most 256 sizes
+# for each of the 2 and 4 octet ASN formats.
+_ASN_ARRAYS = {}
+_SEG_HDR = struct.Struct('!BB')
+
+
+def _asn_array(num_ases, asn_fmt_char):
+    """Return a cached Struct for one AS path segment body"""
+    key = (num_ases, asn_fmt_char)
+    fmt = _ASN_ARRAYS.get(key)
+    if fmt is None:
+        fmt = _ASN_ARRAYS[key] = struct.Struct('!%d%s' % key)
+    return fmt
+
+
 class ASPath(Attribute):
     """
         AS_PATH is a well-known mandatory attribute that is composed
@@ -51,6 +66,7 @@ class ASPath(Attribute):
     AS_SEQUENCE = 0x02
     AS_CONFED_SEQUENCE = 0x03
     AS_CONFED_SET = 0x04
+    SEGMENT_TYPES = frozenset([AS_SET, AS_SEQUENCE, AS_CONFED_SEQUENCE, AS_CONFED_SET])
 
     ID = AttributeID.AS_PATH
     FLAG = AttributeFlag.TRANSITIVE
@@ -65,6 +81,7 @@ class ASPath(Attribute):
         :param value: raw binary balue
         """
         aspath = []
+        append = aspath.append
         offset = 0
         total_len = len(value)
 
@@ -72,12 +89,7 @@ class ASPath(Attribute):
         asn_byte_len = 4 if asn4 else 2
         asn_fmt_char = 'I' if asn4 else 'H'
 
-        valid_types = {
-            cls.AS_SET,
-            cls.AS_SEQUENCE,
-            cls.AS_CONFED_SEQUENCE,
-            cls.AS_CONFED_SET
-        }
+        valid_types = cls.SEGMENT_TYPES
 
         while offset < total_len:
             if offset + 2 > total_len:
@@ -85,7 +97,7 @@ class ASPath(Attribute):
                     sub_error=bgp_cons.ERR_MSG_UPDATE_ATTR_LEN,
                     data='')
 
-            seg_type, num_ases = struct.unpack_from('!BB', value, offset)
+            seg_type, num_ases = _SEG_HDR.unpack_from(value, offset)
 
             if seg_type not in valid_types:
                 raise excep.UpdateMessageError(
@@ -101,10 +113,9 @@ class ASPath(Attribute):
                     sub_error=bgp_cons.ERR_MSG_UPDATE_ATTR_LEN,
                     data='')
 
-            fmt = '!%d%s' % (num_ases, asn_fmt_char)
-            segment = list(struct.unpack_from(fmt, value, offset))
+            segment = list(_asn_array(num_ases, asn_fmt_char).unpack_from(value, offset))
 
-            aspath.append((seg_type, segment))
+            append((seg_type, segment))
             offset += segment_byte_len
 
         return aspath
@@ -120,30 +131,22 @@ class ASPath(Attribute):
         # value example
         # [(2, [3257, 31027, 34848, 21465])], or [(3, [64606]), (2, [64624, 65515])]
 
-        as_path_raw = b''
+        # 4 bytes or 2 bytes asn encode
+        asn_fmt_char = 'I' if asn4 else 'H'
+        as_path_segs = []
         for segment in value:
-            as_seg_raw = b''
             seg_type = segment[0]
             as_path_list = segment[1]
-            if seg_type not in [cls.AS_SET, cls.AS_SEQUENCE, cls.AS_CONFED_SET, cls.AS_CONFED_SEQUENCE]:
+            if seg_type not in cls.SEGMENT_TYPES:
                 assert excep.UpdateMessageError(
                     sub_error=bgp_cons.ERR_MSG_UPDATE_MALFORMED_ASPATH,
                     data='')
 
-            if asn4:
-                #  4 bytes asn encode
-                as_count = 0
-                for asn in as_path_list:
-                    as_count += 1
-                    as_seg_raw += struct.pack('!I', asn)
-            else:
-                # 2 bytes asn encode
-                as_count = 0
-                for asn in as_path_list:
-                    as_count += 1
-                    as_seg_raw += struct.pack('!H', asn)
-
-            as_path_raw += struct.pack('!B', seg_type) + struct.pack('!B', as_count) + as_seg_raw
+            as_count = len(as_path_list)
+            as_path_segs.append(_SEG_HDR.pack(seg_type, as_count))
+            as_path_segs.append(_asn_array(as_count, asn_fmt_char).pack(*as_path_list))
+
+        as_path_raw = b''.join(as_path_segs)
 
         flags = cls.FLAG
         if len(as_path_raw) > 255:
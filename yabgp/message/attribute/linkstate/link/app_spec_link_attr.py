@@ -13,11 +13,26 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import struct
 import binascii
+import struct
+
 from yabgp.message.attribute.linkstate.linkstate import LinkState
 from yabgp.tlv import TLV
 
+_MASK_LENS = struct.Struct('!BB')
+
+
+def _decode_mask(data, offset, length):
+    """Return an application identifier bit mask as a hex string
+
+    :param data: TLV data
+    :param offset: offset of the mask in data
+    :param length: mask length in octets, must not be 0
+    """
+    if offset + length > len(data):
+        raise ValueError('bit mask length %d exceeds TLV data' % length)
+    return '0x' + binascii.b2a_hex(data[offset:offset + length]).decode('ascii')
+
 
 @LinkState.register()
 class AppSpecLinkAttr(TLV):
@@ -48,6 +63,7 @@ class AppSpecLinkAttr(TLV):
     """
     TYPE = 1122
     TYPE_STR = 'ASLA'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
@@ -58,56 +74,18 @@ class AppSpecLinkAttr(TLV):
         :return: AppSpecLinkAttr instance
         """
         # Parse fixed header (4 bytes)
-        sabm_len = data[0]
-        udabm_len = data[1]
+        sabm_len, udabm_len = _MASK_LENS.unpack_from(data)
         # reserved = struct.unpack('!H', data[2:4])[0]
 
-        offset = 4
-
+        # Most ASLA TLVs carry no masks, a zero length mask is absent and
+        # skips the decode call
         # Parse SABM (Standard Application Identifier Bit Mask)
-        sabm = None
-        if sabm_len > 0:
-            sabm_bytes = data[offset:offset + sabm_len]
-            if sabm_len == 4:
-                sabm_int = struct.unpack('!I', sabm_bytes)[0]
-                sabm = '0x{:08x}'.format(sabm_int)
-            elif sabm_len == 8:
-                sabm_int = struct.unpack('!Q', sabm_bytes)[0]
-                sabm = '0x{:016x}'.format(sabm_int)
-            else:
-                sabm = '0x' + binascii.b2a_hex(sabm_bytes).decode('ascii')
-            offset += sabm_len
-
+        sabm = _decode_mask(data, 4, sabm_len) if sabm_len else None
         # Parse UDABM (User-Defined Application Identifier Bit Mask)
-        udabm = None
-        if udabm_len > 0:
-            udabm_bytes = data[offset:offset + udabm_len]
-            if udabm_len == 4:
-                udabm_int = struct.unpack('!I', udabm_bytes)[0]
-                udabm = '0x{:08x}'.format(udabm_int)
-            elif udabm_len == 8:
-                udabm_int = struct.unpack('!Q', udabm_bytes)[0]
-                udabm = '0x{:016x}'.format(udabm_int)
-            else:
-                udabm = '0x' + binascii.b2a_hex(udabm_bytes).decode('ascii')
-            offset += udabm_len
+        udabm = _decode_mask(data, 4 + sabm_len, udabm_len) if udabm_len else None
 
         # Parse Link Attribute sub-TLVs
-        sub_tlvs_bin_data = data[offset:]
-        sub_tlvs = []
-
-        while sub_tlvs_bin_data:
-            sub_tlv_type, sub_tlv_len = struct.unpack('!HH', sub_tlvs_bin_data[:4])
-            sub_tlv_value = sub_tlvs_bin_data[4:4 + sub_tlv_len]
-
-            if sub_tlv_type in LinkState.registered_tlvs:
-                sub_tlvs.append(LinkState.registered_tlvs[sub_tlv_type].unpack(sub_tlv_value).dict())
-            else:
-                sub_tlvs.append({
-                    'type': sub_tlv_type,
-                    'value': str(binascii.b2a_hex(sub_tlv_value))
-                })
-            sub_tlvs_bin_data = sub_tlvs_bin_data[4 + sub_tlv_len:]
+        sub_tlvs = LinkState.unpack_sub_tlvs(data, 4 + sabm_len + udabm_len)
 
         return cls(value={
             'sabm': {'len': sabm_len, 'value': sabm},
@@ -23,6 +23,8 @@ from yabgp.message.attribute import Attribute, AttributeFlag, AttributeID
 
 LOG = logging.getLogger()
 
+_HH = struct.Struct('!HH')
+
 
 class LinkState(Attribute):
     """BGP link-state attribute
@@ -57,6 +59,37 @@ class LinkState(Attribute):
         """
         return {self.ID: self.value}
 
+    @classmethod
+    def unpack_sub_tlvs(cls, data, offset=0):
+        """unpack the sub tlvs carried from offset to the end of data
+
+        :param data: binary data of the enclosing tlv
+        :param offset: offset of the first sub tlv
+        :return: list of sub tlv dicts
+        """
+        end = len(data)
+        sub_tlvs = []
+        append = sub_tlvs.append
+        get_tlv = cls.registered_tlvs.get
+
+        while offset < end:
+            if offset + 4 > end:
+                raise ValueError('incomplete sub-TLV header at offset %d' % offset)
+            type_code, length = _HH.unpack_from(data, offset)
+            value = data[offset + 4:offset + 4 + length]
+
+            tlv = get_tlv(type_code)
+            if tlv is not None:
+                append(tlv.unpack(value).dict())
+            else:
+                append({
+                    'type': type_code,
+                    'value': binascii.b2a_hex(value).decode('ascii')
+                })
+            offset += 4 + length
+
+        return sub_tlvs
+
     @classmethod
     def unpack(cls, data, bgpls_pro_id=None):
         """unpack binary data
@@ -74,7 +107,7 @@ class LinkState(Attribute):
                     tlvs.append(
                         {
                             'type': type_code,
-                            'value': str(binascii.b2a_hex(value))
+                            'value': binascii.b2a_hex(value).decode('ascii')
                         }
                     )
             except Exception as e:
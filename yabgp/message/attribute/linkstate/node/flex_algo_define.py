@@ -14,11 +14,37 @@
 #    under the License.
 
 import struct
-import binascii
 
 from yabgp.message.attribute.linkstate.linkstate import LinkState
 from yabgp.tlv import TLV
 
+_FAD_HDR = struct.Struct('!BBBB')
+_U32_ARRAY_CACHE_SIZE = 32
+_U32_ARRAYS = {}
+
+
+def _u32_array(count):
+    """Return a Struct for ``count`` network order 32-bit integers
+
+    Structs for up to _U32_ARRAY_CACHE_SIZE values are cached. Longer lists
+    are rare and get a throwaway Struct, so a peer controlled length never
+    lands in a cache.
+    """
+    fmt = _U32_ARRAYS.get(count)
+    if fmt is None:
+        fmt = struct.Struct('!%dI' % count)
+        if count <= _U32_ARRAY_CACHE_SIZE:
+            _U32_ARRAYS[count] = fmt
+    return fmt
+
+
+def _unpack_u32_list(data):
+    """Decode a buffer of 4-octet values in a single C call"""
+    count, remainder = divmod(len(data), 4)
+    if remainder:
+        raise struct.error('length %d is not a multiple of 4 octets' % len(data))
+    return list(_u32_array(count).unpack(data))
+
 
 @LinkState.register()
 class FlexAlgorithmDefine(TLV):
@@ -46,6 +72,7 @@ class FlexAlgorithmDefine(TLV):
     """
     TYPE = 1039
     TYPE_STR = 'flex_algo_defn'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
@@ -56,24 +83,10 @@ class FlexAlgorithmDefine(TLV):
         :return: FlexAlgorithmDefine instance
         """
         # Parse fixed fields (4 bytes)
-        flex_algo, metric_type, calc_type, priority = struct.unpack('!BBBB', data[:4])
+        flex_algo, metric_type, calc_type, priority = _FAD_HDR.unpack_from(data)
 
         # Parse sub-TLVs if present
-        sub_tlvs_bin_data = data[4:]
-        sub_tlvs = []
-
-        while sub_tlvs_bin_data:
-            sub_tlvs_type_code, sub_tlvs_length = struct.unpack('!HH', sub_tlvs_bin_data[:4])
-            sub_tlvs_value = sub_tlvs_bin_data[4: 4 + sub_tlvs_length]
-
-            if sub_tlvs_type_code in LinkState.registered_tlvs:
-                sub_tlvs.append(LinkState.registered_tlvs[sub_tlvs_type_code].unpack(sub_tlvs_value).dict())
-            else:
-                sub_tlvs.append({
-                    'type': sub_tlvs_type_code,
-                    'value': str(binascii.b2a_hex(sub_tlvs_value))
-                })
-            sub_tlvs_bin_data = sub_tlvs_bin_data[4 + sub_tlvs_length:]
+        sub_tlvs = LinkState.unpack_sub_tlvs(data, 4)
 
         return cls(value={
             'flex_algo': flex_algo,
@@ -104,6 +117,7 @@ class FlexAlgoExcludeAdminGroup(TLV):
     """
     TYPE = 1040
     TYPE_STR = 'flex_algo_excl_admin_group'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
@@ -113,10 +127,7 @@ class FlexAlgoExcludeAdminGroup(TLV):
         :param data: binary data
         :return: list of 32-bit admin group values
         """
-        admin_groups = []
-        for i in range(0, len(data), 4):
-            admin_groups.append(struct.unpack('!I', data[i:i+4])[0])
-        return cls(value=admin_groups)
+        return cls(value=_unpack_u32_list(data))
 
 
 @LinkState.register()
@@ -139,6 +150,7 @@ class FlexAlgoIncludeAnyAdminGroup(TLV):
     """
     TYPE = 1041
     TYPE_STR = 'flex_algo_incl_any_admin_group'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
@@ -148,10 +160,7 @@ class FlexAlgoIncludeAnyAdminGroup(TLV):
         :param data: binary data
         :return: list of 32-bit admin group values
         """
-        admin_groups = []
-        for i in range(0, len(data), 4):
-            admin_groups.append(struct.unpack('!I', data[i:i+4])[0])
-        return cls(value=admin_groups)
+        return cls(value=_unpack_u32_list(data))
 
 
 @LinkState.register()
@@ -175,6 +184,7 @@ class FlexAlgoIncludeAllAdminGroup(TLV):
     """
     TYPE = 1042
     TYPE_STR = 'flex_algo_incl_all_admin_group'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
@@ -184,10 +194,7 @@ class FlexAlgoIncludeAllAdminGroup(TLV):
         :param data: binary data
         :return: list of 32-bit admin group values
         """
-        admin_groups = []
-        for i in range(0, len(data), 4):
-            admin_groups.append(struct.unpack('!I', data[i:i+4])[0])
-        return cls(value=admin_groups)
+        return cls(value=_unpack_u32_list(data))
 
 
 @LinkState.register()
@@ -211,18 +218,21 @@ class FlexAlgoDefinitionFlags(TLV):
     """
     TYPE = 1043
     TYPE_STR = 'flex_algo_defn_flags'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
         """
         Unpack Flex-Algorithm Definition Flags
 
-        :param data: binary data (2 bytes)
+        :param data: binary data (at least 1 octet), only the M-flag in the
+            first octet is read
         :return: dict with flag values
         """
-        flags = struct.unpack('!H', data[:2])[0]
+        if not data:
+            raise ValueError('empty Flex-Algorithm Definition Flags')
         flag = {
-            'M': flags >> 15  # M-flag is the most significant bit
+            'M': ord(data[0:1]) >> 7  # M-flag is the most significant bit
         }
         return cls(value=flag)
 
@@ -252,6 +262,7 @@ class FlexAlgoExcludeSRLG(TLV):
     """
     TYPE = 1044
     TYPE_STR = 'flex_algo_excl_srlg'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
@@ -261,7 +272,4 @@ class FlexAlgoExcludeSRLG(TLV):
         :param data: binary data
         :return: list of 32-bit SRLG values
         """
-        srlg_list = []
-        for i in range(0, len(data), 4):
-            srlg_list.append(struct.unpack('!I', data[i:i+4])[0])
-        return cls(value=srlg_list)
+        return cls(value=_unpack_u32_list(data))
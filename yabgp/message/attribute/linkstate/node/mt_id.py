@@ -18,6 +18,33 @@ from yabgp.tlv import TLV
 from ..linkstate import LinkState
 
 
+_U16_ARRAY_CACHE_SIZE = 32
+_U16_ARRAYS = {}
+
+
+def _u16_array(count):
+    """Return a Struct for ``count`` network order 16-bit integers
+
+    Structs for up to _U16_ARRAY_CACHE_SIZE values are cached. Longer lists
+    are rare and get a throwaway Struct, so a peer controlled length never
+    lands in a cache.
+    """
+    fmt = _U16_ARRAYS.get(count)
+    if fmt is None:
+        fmt = struct.Struct('!%dH' % count)
+        if count <= _U16_ARRAY_CACHE_SIZE:
+            _U16_ARRAYS[count] = fmt
+    return fmt
+
+
+def _unpack_u16_list(data):
+    """Decode a buffer of 2-octet values in a single C call"""
+    count, remainder = divmod(len(data), 2)
+    if remainder:
+        raise struct.error('length %d is not a multiple of 2 octets' % len(data))
+    return list(_u16_array(count).unpack(data))
+
+
 @LinkState.register()
 class MultiTopologyIdentifier(TLV):
     """MultiTopologyIdentifier TLV (Type 263)
@@ -41,11 +68,9 @@ class MultiTopologyIdentifier(TLV):
     """
     TYPE = 263
     TYPE_STR = 'mt_id'
+    __slots__ = ()
 
     @classmethod
     def unpack(cls, data):
-        mt_id = []
-        while data:
-            mt_id.append(struct.unpack('!H', data[:2])[0])
-            data = data[2:]
-        return cls(value=mt_id)
+        mt_id = _unpack_u16_list(data)
+        return cls(value=[item & 0x0FFF for item in mt_id])
@@ -21,6 +21,7 @@ import netaddr
 from yabgp.common import exception as excp
 from yabgp.common import constants as bgp_cons
 from yabgp.common.constants import AFI_SAFI_STR_DICT
+from yabgp.common.constants import ADD_PATH_ACT_STR_DICT
 
 
 class Open(object):
@@ -451,13 +452,7 @@ class Capability(object):
 
 
 def convert_addpath_str_to_int(addpath_list):
-    addpath_int_list = []
-    send_receive_dict = {
-        'receive': 1,
-        'send': 2,
-        'both': 3
-    }
-    for addpath in addpath_list:
-        addpath_int_list.append([AFI_SAFI_STR_DICT[addpath['afi_safi']], send_receive_dict[addpath['send/receive']]])
-
-    return addpath_int_list
+    return [
+        [AFI_SAFI_STR_DICT[addpath['afi_safi']], ADD_PATH_ACT_STR_DICT[addpath['send/receive']]]
+        for addpath in addpath_list
+    ]
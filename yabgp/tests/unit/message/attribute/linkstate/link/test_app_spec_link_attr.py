@@ -184,7 +184,7 @@ class TestAppSpecLinkAttr(unittest.TestCase):
         self.assertEqual(len(result['value']['sub_tlvs']), 1)
         self.assertEqual(result['value']['sub_tlvs'][0]['type'], 65535)
         # Unknown sub-TLV value is returned as hex string
-        self.assertIn('deadbeef', result['value']['sub_tlvs'][0]['value'].lower())
+        self.assertEqual('deadbeef', result['value']['sub_tlvs'][0]['value'])
 
     def test_unpack_with_multiple_sub_tlvs(self):
         """Test unpack ASLA TLV with multiple sub-TLVs
@@ -340,11 +340,11 @@ class TestAppSpecLinkAttr(unittest.TestCase):
                 - UDABM Length: 0x00 = 0
                 - Reserved: 0x0000
             Sub-TLV: incomplete header (only 2 bytes, needs 4 for type+length)
-        Expected: struct.error
+        Expected: ValueError
         """
         data_bin = bytes.fromhex('000000000444')  # Incomplete sub-TLV header
 
-        with self.assertRaises((Exception,)):
+        with self.assertRaises(ValueError):
             AppSpecLinkAttr.unpack(data_bin)
 
 
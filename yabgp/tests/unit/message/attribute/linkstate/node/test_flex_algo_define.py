@@ -15,6 +15,7 @@
 
 """ Test Flex Algorithm Definition TLV """
 
+import struct
 import unittest
 
 from yabgp.message.attribute.linkstate.node.flex_algo_define import (
@@ -84,6 +85,51 @@ class TestFlexAlgorithmDefine(unittest.TestCase):
         }
         self.assertEqual(expected, FlexAlgorithmDefine.unpack(data_bin).dict())
 
+    def test_unpack_with_unknown_sub_tlv(self):
+        """Test unpack FAD TLV with unknown sub-TLV type
+
+        Data: 80 00 00 00 ff ff 00 02 ab cd
+            Fixed fields (4 bytes):
+                - Flex-Algo: 0x80 = 128
+                - Metric-Type: 0x00 = 0 (IGP Metric)
+                - Calc-Type: 0x00 = 0 (SPF)
+                - Priority: 0x00 = 0
+            Sub-TLV (6 bytes):
+                - Type: 0xffff = 65535 (Unknown)
+                - Length: 0x0002 = 2
+                - Value: 0xabcd
+        """
+        data_bin = bytes.fromhex('80000000' + 'ffff0002abcd')
+        expected = {
+            'type': 'flex_algo_defn',
+            'value': {
+                'flex_algo': 128,
+                'metric_type': 0,
+                'calc_type': 0,
+                'priority': 0,
+                'sub_tlvs': [
+                    {
+                        'type': 65535,
+                        'value': 'abcd'
+                    }
+                ]
+            }
+        }
+        self.assertEqual(expected, FlexAlgorithmDefine.unpack(data_bin).dict())
+
+    def test_unpack_sub_tlv_header_incomplete(self):
+        """Test unpack FAD TLV where sub-TLV header is incomplete
+
+        Data: 80 01 00 80 04 13 00
+            Fixed fields (4 bytes)
+            Sub-TLV: incomplete header (only 3 bytes, needs 4 for type+length)
+        Expected: ValueError
+        """
+        data_bin = bytes.fromhex('80010080' + '041300')
+
+        with self.assertRaises(ValueError):
+            FlexAlgorithmDefine.unpack(data_bin)
+
 
 class TestFlexAlgoExcludeAdminGroup(unittest.TestCase):
     """Test FlexAlgoExcludeAdminGroup TLV (Type 1040)"""
@@ -116,6 +162,16 @@ class TestFlexAlgoExcludeAdminGroup(unittest.TestCase):
         }
         self.assertEqual(expected, FlexAlgoExcludeAdminGroup.unpack(data_bin).dict())
 
+    def test_unpack_truncated_group(self):
+        """Test unpack with a trailing partial admin group
+
+        Data: 00 00 00 01 00 00 (6 bytes, second group is incomplete)
+        Expected: struct.error
+        """
+        data_bin = bytes.fromhex('000000010000')
+        with self.assertRaises(struct.error):
+            FlexAlgoExcludeAdminGroup.unpack(data_bin)
+
 
 class TestFlexAlgoIncludeAnyAdminGroup(unittest.TestCase):
     """Test FlexAlgoIncludeAnyAdminGroup TLV (Type 1041)"""
@@ -174,6 +230,15 @@ class TestFlexAlgoDefinitionFlags(unittest.TestCase):
         }
         self.assertEqual(expected, FlexAlgoDefinitionFlags.unpack(data_bin).dict())
 
+    def test_unpack_empty_data(self):
+        """Test unpack with empty data
+
+        Data: (empty)
+        Expected: ValueError
+        """
+        with self.assertRaises(ValueError):
+            FlexAlgoDefinitionFlags.unpack(b'')
+
 
 class TestFlexAlgoExcludeSRLG(unittest.TestCase):
     """Test FlexAlgoExcludeSRLG TLV (Type 1044)"""
@@ -196,6 +261,15 @@ class TestFlexAlgoExcludeSRLG(unittest.TestCase):
         }
         self.assertEqual(expected, FlexAlgoExcludeSRLG.unpack(data_bin).dict())
 
+    def test_unpack_long_srlg_list(self):
+        """Test unpack with more SRLG values than the cached decoders cover"""
+        data_bin = b''.join(struct.pack('!I', srlg) for srlg in range(100))
+        expected = {
+            'type': 'flex_algo_excl_srlg',
+            'value': list(range(100))
+        }
+        self.assertEqual(expected, FlexAlgoExcludeSRLG.unpack(data_bin).dict())
+
 
 if __name__ == "__main__":
     unittest.main()
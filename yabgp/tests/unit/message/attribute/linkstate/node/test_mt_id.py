@@ -15,6 +15,7 @@
 
 """ Test Multi-Topology Identifier TLV """
 
+import struct
 import unittest
 
 from yabgp.message.attribute.linkstate.node.mt_id import MultiTopologyIdentifier
@@ -88,16 +89,33 @@ class TestMultiTopologyIdentifier(unittest.TestCase):
         self.assertEqual(expected, MultiTopologyIdentifier.unpack(data_bin).dict())
 
     def test_unpack_max_mt_id(self):
-        """Test unpack with maximum MT-ID value (0xFFFF)
+        """Test unpack with maximum MT-ID value (0xFFF)
 
         Data: ff ff
-            - MT-ID: 0xFFFF = 65535 (maximum value)
+            - Reserved: 0xF (ignored)
+            - MT-ID: 0xFFF = 4095 (maximum value)
         """
         data_bin = bytes.fromhex('ffff')
 
         expected = {
             'type': 'mt_id',
-            'value': [65535]
+            'value': [4095]
+        }
+
+        self.assertEqual(expected, MultiTopologyIdentifier.unpack(data_bin).dict())
+
+    def test_unpack_reserved_bits_ignored(self):
+        """Test unpack ignores the 4 reserved bits
+
+        Data: 80 02 f0 03
+            - MT-ID 1: 0x8002 -> 0x002 = 2
+            - MT-ID 2: 0xf003 -> 0x003 = 3
+        """
+        data_bin = bytes.fromhex('8002f003')
+
+        expected = {
+            'type': 'mt_id',
+            'value': [2, 3]
         }
 
         self.assertEqual(expected, MultiTopologyIdentifier.unpack(data_bin).dict())
@@ -122,6 +140,17 @@ class TestMultiTopologyIdentifier(unittest.TestCase):
 
         self.assertEqual(expected, MultiTopologyIdentifier.unpack(data_bin).dict())
 
+    def test_unpack_many_mt_ids(self):
+        """Test unpack with more MT-IDs than the cached decoders cover"""
+        data_bin = b''.join(struct.pack('!H', mt_id) for mt_id in range(100))
+
+        expected = {
+            'type': 'mt_id',
+            'value': list(range(100))
+        }
+
+        self.assertEqual(expected, MultiTopologyIdentifier.unpack(data_bin).dict())
+
     # ==================== Exception/Abnormal Packet Tests ====================
 
     def test_unpack_single_byte(self):
@@ -132,7 +161,7 @@ class TestMultiTopologyIdentifier(unittest.TestCase):
         """
         data_bin = bytes.fromhex('00')
 
-        with self.assertRaises(Exception):
+        with self.assertRaises(struct.error):
             MultiTopologyIdentifier.unpack(data_bin)
 
     def test_unpack_odd_bytes_3(self):
@@ -141,11 +170,11 @@ class TestMultiTopologyIdentifier(unittest.TestCase):
         Data: 00 02 00 (3 bytes, last byte is incomplete)
             - MT-ID 1: 0x0002 = 2 (parsed successfully)
             - Remaining: 0x00 (incomplete, only 1 byte)
-        Expected: struct.error on second iteration
+        Expected: struct.error
         """
         data_bin = bytes.fromhex('000200')
 
-        with self.assertRaises(Exception):
+        with self.assertRaises(struct.error):
             MultiTopologyIdentifier.unpack(data_bin)
 
     def test_unpack_odd_bytes_5(self):
@@ -155,11 +184,11 @@ class TestMultiTopologyIdentifier(unittest.TestCase):
             - MT-ID 1: 0x0002 = 2
             - MT-ID 2: 0x0003 = 3
             - Remaining: 0x00 (incomplete)
-        Expected: struct.error on third iteration
+        Expected: struct.error
         """
         data_bin = bytes.fromhex('0002000300')
 
-        with self.assertRaises(Exception):
+        with self.assertRaises(struct.error):
             MultiTopologyIdentifier.unpack(data_bin)
 
 
@@ -82,3 +82,13 @@ class TestLinkState(unittest.TestCase):
             }
         ]}
         self.assertEqual(data_dict, LinkState.unpack(data_bin).dict())
+
+    def test_unpack_unknown_tlv(self):
+        data_bin = b'\xff\xfe\x00\x02\xab\xcd'
+        data_dict = {29: [
+            {
+                'type': 65534,
+                'value': 'abcd'
+            }
+        ]}
+        self.assertEqual(data_dict, LinkState.unpack(data_bin).dict())
@@ -16,6 +16,7 @@
 """Test Add Path Capability"""
 
 import unittest
+from yabgp.config import convert_addpath_config
 from yabgp.message.open import convert_addpath_str_to_int
 
 
@@ -195,19 +196,15 @@ class TestAddPathCapability(unittest.TestCase):
 class TestLocalAddPathConfig(unittest.TestCase):
     """
     Test cases for local_add_path configuration processing in config.py
-    Tests the list comprehension that converts local_add_path strings to dictionaries
+    Tests convert_addpath_config, which converts local_add_path strings to dictionaries
     """
 
     def test_local_add_path_single_ipv4_both(self):
         """
         Test processing single IPv4 both mode configuration
         """
-        # Simulate the list comprehension from config.py line 137-139
         local_add_path_config = ['ipv4_both']
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = [
             {'afi_safi': 'ipv4', 'send/receive': 'both'}
         ]
@@ -218,10 +215,7 @@ class TestLocalAddPathConfig(unittest.TestCase):
         Test processing single IPv4 receive mode configuration
         """
         local_add_path_config = ['ipv4_receive']
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = [
             {'afi_safi': 'ipv4', 'send/receive': 'receive'}
         ]
@@ -232,10 +226,7 @@ class TestLocalAddPathConfig(unittest.TestCase):
         Test processing single IPv4 send mode configuration
         """
         local_add_path_config = ['ipv4_send']
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = [
             {'afi_safi': 'ipv4', 'send/receive': 'send'}
         ]
@@ -246,10 +237,7 @@ class TestLocalAddPathConfig(unittest.TestCase):
         Test processing multiple address families configuration
         """
         local_add_path_config = ['ipv4_both', 'ipv6_receive', 'vpnv4_send']
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = [
             {'afi_safi': 'ipv4', 'send/receive': 'both'},
             {'afi_safi': 'ipv6', 'send/receive': 'receive'},
@@ -263,10 +251,7 @@ class TestLocalAddPathConfig(unittest.TestCase):
         Note: ipv4_lu has two underscores, rsplit('_', 1) only splits the last one
         """
         local_add_path_config = ['ipv4_lu_both', 'ipv6_lu_receive']
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = [
             {'afi_safi': 'ipv4_lu', 'send/receive': 'both'},
             {'afi_safi': 'ipv6_lu', 'send/receive': 'receive'}
@@ -278,10 +263,7 @@ class TestLocalAddPathConfig(unittest.TestCase):
         Test processing empty configuration list
         """
         local_add_path_config = []
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = []
         self.assertEqual(expected, result)
 
@@ -290,10 +272,7 @@ class TestLocalAddPathConfig(unittest.TestCase):
         Test all modes (send, receive, both)
         """
         local_add_path_config = ['ipv4_send', 'ipv6_receive', 'vpnv4_both']
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = [
             {'afi_safi': 'ipv4', 'send/receive': 'send'},
             {'afi_safi': 'ipv6', 'send/receive': 'receive'},
@@ -311,10 +290,7 @@ class TestLocalAddPathConfig(unittest.TestCase):
             'ipv4_srte_send',
             'ipv6_flowspec_both'
         ]
-        result = [
-            {'afi_safi': item.rsplit('_', 1)[0], 'send/receive': item.rsplit('_', 1)[1]}
-            for item in local_add_path_config
-        ]
+        result = convert_addpath_config(local_add_path_config)
         expected = [
             {'afi_safi': 'ipv4_lu', 'send/receive': 'both'},
             {'afi_safi': 'ipv6_lu', 'send/receive': 'receive'},